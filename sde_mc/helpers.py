@@ -30,7 +30,7 @@ def partition(interval, steps, ends='right', device='cpu'):
         left = 0
     else:
         left = 1
-    return torch.tensor([interval * i / steps for i in range(left, right)], device=device)
+    return torch.arange(left, right, device=device) * (interval / steps)
 
 
 def solve_quadratic(coefficients):
@@ -70,14 +70,18 @@ class LevySde(Sde):
         super(LevySde, self).__init__(init_value, levy.dim, levy.dim * 2, 'indep', corr_matrix)
         self.levy = levy
         self.scale_rate = scale_jump_rate
+        # constants of the small jump approximation, passed straight through as the jump size so they are folded into
+        # the jump coefficient instead of scaling it with a separate multiplication at every step
+        self.small_jump_gamma = float(levy.gamma())
+        self.small_jump_beta = float(levy.beta())
 
     def drift(self, t, x):
-        return self.levy.drift(t, x) - self.levy.jumps(t, x, 1) * self.levy.gamma()
+        return self.levy.drift(t, x) - self.levy.jumps(t, x, self.small_jump_gamma)
 
     def diffusion(self, t, x):
         """Needs to combine both diffusions into a vector. Need to add some noise_type parameter
         for when one dimension depends on multiple Brownian motions. Or noise_dim != dim"""
-        return torch.stack([self.levy.diffusion(t, x), self.levy.jumps(t, x, 1) * self.levy.beta()], dim=-1)
+        return torch.stack([self.levy.diffusion(t, x), self.levy.jumps(t, x, self.small_jump_beta)], dim=-1)
 
     def jumps(self, t, x, jumps):
         return self.levy.jumps(t, x, jumps)
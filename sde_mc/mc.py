@@ -1,10 +1,9 @@
 import time
 import numpy as np
 import torch
-from torch.utils.data import DataLoader
 from .varred import train_diffusion_control_variate, apply_diffusion_control_variate, train_adapted_control_variates, \
     apply_adapted_control_variates, EarlyStopping
-from .nets import NormalJumpsPathData, NormalPathData, AdaptedPathData, Mlp
+from .nets import NormalJumpsPathData, NormalPathData, AdaptedPathData, PathDataLoader, Mlp
 from .helpers import partition, mc_estimates, ceil_mult, sample_cov
 from .options import ConstantShortRate
 import gc
@@ -124,7 +123,7 @@ def mc_simple(num_trials, sde_solver, payoff, discounter=None, bs=None, return_n
 
 
 def mc_control_variates(models, opt, solver, trials, steps, payoff, discounter, sim_bs=(1e5, 1e5),
-                        bs=(1000, 1000), epochs=10, print_losses=True, tol=0, early_stopping=None):
+                        bs=(1000, 1000), epochs=10, print_losses=True, tol=0, early_stopping=None, amp_dtype=None):
     """Monte Carlo simulation of a functional of an SDE's terminal value with neural control variates
 
     Generates initial trajectories and payoffs on which regression is performed to find optimal control variates (a
@@ -164,6 +163,10 @@ def mc_control_variates(models, opt, solver, trials, steps, payoff, discounter,
     :param print_losses: bool (default = True)
         If True, prints the loss function values during training
 
+    :param amp_dtype: torch.dtype (default = None)
+        If given, the control variate(s) are evaluated with autocast in this dtype during inference, e.g.
+        torch.bfloat16
+
     :return: MCStatistics
         The relevant MC statistics
     """
@@ -186,13 +189,13 @@ def mc_control_variates(models, opt, solver, trials, steps, payoff, discounter,
 
     # Inference
     solver.num_steps = test_steps
-    mc_stats = mc_apply_cvs(models, solver, test_trials, payoff, discounter, test_sim_bs, test_bs, tol)
+    mc_stats = mc_apply_cvs(models, solver, test_trials, payoff, discounter, test_sim_bs, test_bs, tol, amp_dtype)
     mc_stats.time_elapsed += train_end - train_start
 
     return mc_stats
 
 
-def mc_apply_cvs(models, solver, trials, payoff, discounter, sim_bs=1e5, bs=1000, tol=0):
+def mc_apply_cvs(models, solver, trials, payoff, discounter, sim_bs=1e5, bs=1000, tol=0, amp_dtype=None):
     """Monte Carlo simulation of a function of SDE's terminal value with applied control variates
 
     :param models: callable(s)
@@ -216,6 +219,9 @@ def mc_apply_cvs(models, solver, trials, payoff, discounter, sim_bs=1e5, bs=1000
     :param bs: int
         The batch size for applying the control variate(s)
 
+    :param amp_dtype: torch.dtype (default = None)
+        If given, the control variate(s) are evaluated with autocast in this dtype, e.g. torch.bfloat16
+
     :return: MCStatisitics
         The relevant stats from the MC simulation
     """
@@ -228,10 +234,10 @@ def mc_apply_cvs(models, solver, trials, payoff, discounter, sim_bs=1e5, bs=1000
         trials_remaining -= batch_size
         if solver.has_jumps:
             test_dl = simulate_adapted_data(batch_size, solver, payoff, discounter, bs=bs, inference=True)
-            x, y = apply_adapted_control_variates(models, test_dl, solver, discounter, tol)
+            x, y = apply_adapted_control_variates(models, test_dl, solver, discounter, tol, amp_dtype)
         else:
             test_dl = simulate_data(batch_size, solver, payoff, discounter, bs=bs, inference=True)
-            x, y = apply_diffusion_control_variate(models, test_dl, solver, discounter, tol)
+            x, y = apply_diffusion_control_variate(models, test_dl, solver, discounter, tol, amp_dtype)
         run_sum += x
         run_sum_sq += y
 
@@ -243,7 +249,7 @@ def mc_apply_cvs(models, solver, trials, payoff, discounter, sim_bs=1e5, bs=1000
 
 
 def mc_adaptive_cv(models, opt, solver, trials, steps, payoff, discounter, sim_bs=(1e4, 1e4), bs=(1000, 1000),
-                   epochs=10, print_losses=True, pre_trained=False, tol=0, early_stopping=None):
+                   epochs=10, print_losses=True, pre_trained=False, tol=0, early_stopping=None, amp_dtype=None):
     """Monte Carlo simulation of a functional of an SDE's terminal value with neural control variates
 
         Generates initial trajectories and payoffs on which regression is performed to find optimal control variates (a
@@ -283,6 +289,10 @@ def mc_adaptive_cv(models, opt, solver, trials, steps, payoff, discounter, sim_b
         :param print_losses: bool (default = True)
             If True, prints the loss function values during training
 
+        :param amp_dtype: torch.dtype (default = None)
+            If given, the control variates are evaluated with autocast in this dtype during inference, e.g.
+            torch.bfloat16
+
         :return: MCStatistics
             The relevant MC statistics
         """
@@ -315,7 +325,7 @@ def mc_adaptive_cv(models, opt, solver, trials, steps, payoff, discounter, sim_b
         batch_size = min(test_sim_bs, trials_remaining)
         trials_remaining -= batch_size
         test_dataloader = simulate_adapted_data(batch_size, solver, payoff, discounter, bs=test_bs, inference=True)
-        x, y = apply_adapted_control_variates(models, test_dataloader, solver, discounter, tol)
+        x, y = apply_adapted_control_variates(models, test_dataloader, solver, discounter, tol, amp_dtype)
         run_sum += x
         run_sum_sq += y
 
@@ -376,8 +386,8 @@ def mc_terminal_cv(num_trials, sde_solver, payoff, discounter=None, bs=None, ret
 
 
 def simulate_data(trials, solver, payoff, discounter, bs=1000, inference=False):
-    """Simulates trajectories of an SDE and returns the trajectories, payoffs and random variables in a DataLoader
-    which can be used for training or inference"""
+    """Simulates trajectories of an SDE and returns the trajectories, payoffs and random variables in a
+    PathDataLoader which can be used for training or inference"""
 
     if inference:
         assert not trials % bs, 'Batch size should partition total trials evenly'
@@ -385,7 +395,7 @@ def simulate_data(trials, solver, payoff, discounter, bs=1000, inference=False):
     paths, normals = mc_stats.paths, mc_stats.normals
     payoffs = mc_stats.payoffs
     dset = NormalPathData(paths, payoffs, normals)
-    return DataLoader(dset, batch_size=int(bs), shuffle=not inference, drop_last=not inference)
+    return PathDataLoader(dset, batch_size=int(bs), shuffle=not inference, drop_last=not inference)
 
 
 def simulate_adapted_data(trials, solver, payoff, discounter, bs=1000, inference=False):
@@ -395,7 +405,7 @@ def simulate_adapted_data(trials, solver, payoff, discounter, bs=1000, inference
         payoffs = mc_stats.payoffs
         dset = AdaptedPathData(paths[:, :total_steps+1], payoffs, normals[:, :total_steps], left_paths[:, :total_steps+1],
                                        time_paths[:, :total_steps+1], jump_paths[:, :total_steps+1], total_steps)
-    return DataLoader(dset, batch_size=int(bs), shuffle=not inference, drop_last=not inference)
+    return PathDataLoader(dset, batch_size=int(bs), shuffle=not inference, drop_last=not inference)
 
 
 def sim_train_control_variates(models, opt, solver, trials, payoff, discounter, sim_bs, bs, epochs=10,
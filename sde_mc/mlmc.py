@@ -32,10 +32,10 @@ def mc_multilevel(trials, levels, solver, payoff, discounter, bs=None):
     if bs is None:
         bs = trials
     start = time.time()
-    # Config
-    exps = torch.zeros((len(levels)))
-    vars = torch.zeros(len(levels))
-    trial_numbers = torch.tensor(trials)
+    # Config - the estimates are stored on the solver's device so that writing them does not force a sync
+    exps = torch.zeros(len(levels), device=solver.device)
+    vars = torch.zeros(len(levels), device=solver.device)
+    trial_numbers = torch.tensor(trials, device=solver.device)
 
     # First level
     run_sum, run_sum_sq = 0, 0
@@ -77,9 +77,9 @@ def mc_multilevel(trials, levels, solver, payoff, discounter, bs=None):
 def get_optimal_trials(trials, levels, epsilon, solver, payoff, discounter):
     """Finds the optimal number of trials at each level for the MLMC method (for a given tolerance)"""
 
-    vars = torch.zeros(len(levels))
+    vars = torch.zeros(len(levels), device=solver.device)
     pairs = [(levels[i + 1], levels[i]) for i in range(0, len(levels) - 1)]
-    step_sizes = solver.time_interval / torch.tensor(levels)
+    step_sizes = solver.time_interval / torch.tensor(levels, device=solver.device)
     solver.num_steps = levels[0]
     paths, _ = solver.solve(bs=trials, low_storage=True)
     discounted_payoffs = payoff(paths[:, -1, :]) * discounter(solver.time_interval)
@@ -40,7 +40,7 @@ class Mlp(ControlVariate):
     """Multilayer perceptron (MLP)"""
 
     def __init__(self, input_size, layer_sizes, output_size, activation=nn.ReLU, final_activation=None,
-                 batch_norm=True, batch_norm_init=True, device='cpu'):
+                 batch_norm=True, batch_norm_init=True, device='cpu', compiled=False):
         """
         :param input_size: int
             Input dimensions
@@ -65,6 +65,10 @@ class Mlp(ControlVariate):
 
         :param device: str (default = 'cpu')
             The device to store the model on
+
+        :param compiled: bool (default = False)
+            If True, the forward pass is compiled with torch.compile, which fuses the layers and removes the per-layer
+            Python overhead. The first call (and any call with a new batch size) triggers a compilation
         """
         assert len(layer_sizes) > 0, "At least one hidden layer required."
         super(Mlp, self).__init__(sequential=False, device=device)
@@ -88,10 +92,51 @@ class Mlp(ControlVariate):
             layers += [final_activation()]
 
         self.net = nn.Sequential(*layers)
+        if compiled:
+            self.compile(dynamic=False)
 
     def forward(self, x):
         return self.net(x)
 
+    def fuse_bn(self):
+        """Folds each batch norm layer into its adjacent linear layer using the running statistics, and puts the model
+        in eval mode. The outputs are unchanged (in eval mode) but each forward pass has fewer layers. Should only be
+        called once training is finished
+
+        :return: Mlp
+            The model itself, with the batch norm layers removed
+        """
+        layers = list(self.net)
+        fused = []
+        i = 0
+        with torch.no_grad():
+            while i < len(layers):
+                if not isinstance(layers[i], nn.BatchNorm1d):
+                    fused.append(layers[i])
+                    i += 1
+                    continue
+                bn = layers[i]
+                scale = (bn.running_var + bn.eps).rsqrt()
+                shift = - bn.running_mean * scale
+                if bn.affine:
+                    scale = scale * bn.weight
+                    shift = shift * bn.weight + bn.bias
+                if fused and isinstance(fused[-1], nn.Linear):
+                    # linear -> batch norm
+                    linear = fused[-1]
+                    linear.bias.mul_(scale).add_(shift)
+                    linear.weight.mul_(scale.unsqueeze(1))
+                    i += 1
+                else:
+                    # batch norm on the inputs -> linear
+                    linear = layers[i + 1]
+                    linear.bias.add_(linear.weight @ shift)
+                    linear.weight.mul_(scale.unsqueeze(0))
+                    fused.append(linear)
+                    i += 2
+        self.net = nn.Sequential(*fused)
+        return self.eval()
+
 
 class Lstm(ControlVariate):
     """Long short-term memory RNN (LSTM) model"""
@@ -207,6 +252,46 @@ class AdaptedPathData(Dataset):
                 self.time_paths[idx], self.jump_paths[idx]), self.payoffs[idx]
 
 
+class PathDataLoader:
+    """Iterates over a path dataset in batches. Batches are taken by slicing a (shuffled) index tensor on the same
+    device as the data, so each batch is gathered in one indexing operation rather than sample-by-sample and collated
+    as in torch.utils.data.DataLoader"""
+
+    def __init__(self, dataset, batch_size, shuffle=False, drop_last=False):
+        """
+        :param dataset: NormalPathData, NormalJumpsPathData or AdaptedPathData
+            The dataset to iterate over
+
+        :param batch_size: int
+            The batch size
+
+        :param shuffle: bool (default = False)
+            If True, the data is reshuffled at every epoch
+
+        :param drop_last: bool (default = False)
+            If True, drops the last batch if it is smaller than batch_size
+        """
+        self.dataset = dataset
+        self.batch_size = batch_size
+        self.shuffle = shuffle
+        self.drop_last = drop_last
+
+    def __len__(self):
+        if self.drop_last:
+            return len(self.dataset) // self.batch_size
+        return -(-len(self.dataset) // self.batch_size)
+
+    def __iter__(self):
+        n = len(self.dataset)
+        if self.shuffle:
+            idxs = torch.randperm(n, device=self.dataset.payoffs.device)
+        for i in range(len(self)):
+            if self.shuffle:
+                yield self.dataset[idxs[i * self.batch_size:(i + 1) * self.batch_size]]
+            else:
+                yield self.dataset[i * self.batch_size:(i + 1) * self.batch_size]
+
+
 def get_mlps(problem, num_layers, hidden_size, device):
     d = problem.dim() + 1
     brown_dim = problem.solver.sde.brown_dim
@@ -1,7 +1,7 @@
 import numpy as np
 import torch
 from scipy.integrate import quad
-from scipy.stats import norm, lognorm
+from scipy.stats import norm, lognorm, poisson
 from abc import ABC, abstractmethod
 
 
@@ -88,15 +88,15 @@ def merton_call(spot, strike, expiry, r, sigma, alpha, gamma, rate):
     :return: float
         The value of the option
     """
+    spot, strike, expiry, r, sigma = (np.asarray(v) for v in (spot, strike, expiry, r, sigma))
     beta = np.exp(alpha + 0.5 * gamma * gamma) - 1
-    partial_sum = 0
-    for k in range(40):
-        r_k = r - rate * beta + (k * np.log(beta+1)) / expiry
-        sigma_k = np.sqrt(sigma ** 2 + (k * gamma ** 2) / expiry)
-        k_fact = np.math.factorial(k)
-        partial_sum += (np.exp(-(beta+1) * rate * expiry) * ((beta+1) * rate * expiry) ** k / k_fact) * \
-             bs_call(spot, strike, expiry, r_k, sigma_k)
-    return partial_sum
+    # all terms of the series are evaluated in a single (vectorised) call to bs_call, along a leading axis so that
+    # array-valued parameters are still supported
+    k = np.arange(40).reshape((-1,) + (1,) * np.broadcast(spot, strike, expiry, r, sigma).ndim)
+    r_k = r - rate * beta + (k * np.log(beta+1)) / expiry
+    sigma_k = np.sqrt(sigma ** 2 + (k * gamma ** 2) / expiry)
+    weights = poisson.pmf(k, (beta+1) * rate * expiry)
+    return (weights * bs_call(spot, strike, expiry, r_k, sigma_k)).sum(axis=0)
 
 
 def bs_digital_call(spot, strike, expiry, r, sigma):
@@ -304,9 +304,8 @@ class HestonRainbow(Option):
         self.strike = strike
 
     def payoff(self, x):
-        even_inds = torch.tensor([i for i in range(len(x[0])) if not i%2])
-        x = torch.index_select(x, 1, even_inds)
-        spot = x.max(1).values
+        # the spot prices are in the even columns (the odd columns are the variances)
+        spot = x[:, ::2].max(1).values
         return torch.where(spot > self.strike, spot - self.strike, torch.tensor(0., dtype=spot.dtype,
                                                                                 device=spot.device))
 
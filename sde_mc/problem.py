@@ -1,7 +1,7 @@
 from abc import ABC
 import torch
 from .sde import Gbm, Heston, Merton
-from .solvers import EulerSolver, JumpEulerSolver, HestonSolver
+from .solvers import GbmSolver, JumpEulerSolver, HestonSolver
 from .options import EuroCall, ConstantShortRate, Rainbow, BestOf
 from .levy import LevySde, ExpExampleLevy, ExampleLevy
 from .helpers import get_corr_matrix
@@ -23,7 +23,7 @@ class Problem(ABC):
 class BlackScholesEuroCall(Problem):
     def __init__(self, r, sigma, spot, strike, maturity, steps, device):
         gbm = Gbm(r, sigma, torch.tensor([spot]), 1)
-        solver = EulerSolver(gbm, maturity, steps, device)
+        solver = GbmSolver(gbm, maturity, steps, device)
         csr = ConstantShortRate(r)
         option = EuroCall(strike)
         super().__init__(solver, csr, option)
@@ -37,7 +37,7 @@ class BlackScholesRainbow(Problem):
     def __init__(self, r, sigma, spot, strike, maturity, dim, corr_matrix, steps, device):
         init_value = torch.ones(dim) * spot
         gbm = Gbm(r, sigma, init_value, dim, corr_matrix)
-        solver = EulerSolver(gbm, maturity, steps, device)
+        solver = GbmSolver(gbm, maturity, steps, device)
         csr = ConstantShortRate(r)
         option = Rainbow(strike)
         super().__init__(solver, csr, option)
@@ -4,10 +4,11 @@ from .helpers import solve_quadratic
 
 class EulerScheme:
     def step(self, t, x, h, corr_normals):
+        # addcmul fuses each multiply into the addition, avoiding the intermediate products
         if self.sde.diffusion_struct == 'diag':
-            new_pos = x + self.sde.drift(t, x) * h + self.sde.diffusion(t, x) * corr_normals
+            new_pos = torch.addcmul(torch.addcmul(x, self.sde.drift(t, x), h), self.sde.diffusion(t, x), corr_normals)
         elif self.sde.diffusion_struct == 'indep':
-            new_pos = x + self.sde.drift(t, x) * h + (self.sde.diffusion(t, x) * corr_normals).sum(dim=-1)
+            new_pos = torch.addcmul(x, self.sde.drift(t, x), h) + (self.sde.diffusion(t, x) * corr_normals).sum(dim=-1)
         else:
             new_pos = x + self.sde.drift(t, x) * h + torch.matmul(self.sde.diffusion(t, x) * corr_normals)
         return new_pos
@@ -15,8 +16,17 @@ class EulerScheme:
 
 class HestonScheme:
     def step(self, t, x, h, corr_normals):
-        new_pos = x + self.sde.drift(t, x) * h + self.sde.diffusion(t, x) * corr_normals
+        new_pos = torch.addcmul(torch.addcmul(x, self.sde.drift(t, x), h), self.sde.diffusion(t, x), corr_normals)
         coefs = self.sde.quadratic_parameters(x[:, 1], h, corr_normals[:, 1])
         sol = solve_quadratic(coefs)
         new_pos[:, 1] = sol * sol
-        return new_pos
\ No newline at end of file
+        return new_pos
+
+
+class GbmScheme:
+    """Euler scheme for a Gbm, where the update x + mu * x * h + sigma * x * dW is computed as the single product
+    x * (1 + mu * h + sigma * dW), rather than evaluating the drift and diffusion separately"""
+    def step(self, t, x, h, corr_normals):
+        scale = corr_normals * self.sde.sigma
+        scale += 1 + self.sde.mu * h
+        return x * scale
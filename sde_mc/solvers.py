@@ -2,8 +2,9 @@ import torch
 import torch.nn.functional as F
 from scipy.stats import poisson
 from abc import ABC, abstractmethod
-from .schemes import EulerScheme, HestonScheme
-from .helpers import solve_quadratic
+from .schemes import EulerScheme, HestonScheme, GbmScheme
+from .helpers import solve_quadratic, partition
+from .sde import Gbm
 
 
 class SdeSolver(ABC):
@@ -38,6 +39,8 @@ class SdeSolver(ABC):
 
     @abstractmethod
     def solve(self, bs=1, return_normals=False):
+        """Simulates bs trajectories of the SDE. Implementations run under torch.no_grad, since the trajectories are
+        only used as data and no gradients are taken through the solver"""
         pass
 
     @abstractmethod
@@ -65,11 +68,12 @@ class DiffusionSolver(SdeSolver):
         paths = torch.empty(size=(bs, steps + 1, self.sde.dim), device=self.device)
         return paths
 
+    @torch.no_grad()
     def solve(self, bs=1, return_normals=False):
         bs = int(bs)
         h = torch.tensor(self.time_interval / self.num_steps, device=self.device)
-        x = self.sde.init_value.unsqueeze(0).repeat(bs, 1).to(self.device)
-        t = torch.tensor(0.0, device=self.device)
+        x = self.sde.init_value.to(self.device).expand(bs, -1)
+        time_points = partition(self.time_interval, self.num_steps, ends='left', device=self.device)
 
         paths = self.init_storage(bs, self.num_steps)
         paths[:, 0] = x
@@ -81,12 +85,11 @@ class DiffusionSolver(SdeSolver):
                                                                                                 self.sde.dim)), h=h)
 
         for i in range(self.num_steps):
-            x = self.step(t, x, h, corr_normals[:, i])
-            if True:
-                paths[:, i + 1] = x
-            t += h
+            x = self.step(time_points[i], x, h, corr_normals[:, i])
+            paths[:, i + 1] = x
         return paths, corr_normals
 
+    @torch.no_grad()
     def multilevel_solve(self, bs, levels, return_normals=False):
         bs = int(bs)
         fine, coarse = levels
@@ -94,9 +97,9 @@ class DiffusionSolver(SdeSolver):
 
         h_fine = torch.tensor(self.time_interval / fine, device=self.device)
         h_coarse = factor * h_fine
-        t = torch.tensor(0.0, device=self.device)
-        x_fine = self.sde.init_value.unsqueeze(0).repeat(bs, 1).to(self.device)
-        x_coarse = self.sde.init_value.unsqueeze(0).repeat(bs, 1).to(self.device)
+        time_points = partition(self.time_interval, fine, ends='both', device=self.device)
+        x_fine = self.sde.init_value.to(self.device).expand(bs, -1)
+        x_coarse = self.sde.init_value.to(self.device).expand(bs, -1)
         paths_fine = self.init_storage(bs, fine)
         paths_coarse = self.init_storage(bs, coarse)
         paths_fine[:, 0] = x_fine
@@ -110,10 +113,9 @@ class DiffusionSolver(SdeSolver):
 
         for i in range(coarse):
             for j in range(factor):
-                x_fine = self.step(t, x_fine, h_fine, corr_normals[:, i * factor + j])
-                t += h_fine
+                x_fine = self.step(time_points[i * factor + j], x_fine, h_fine, corr_normals[:, i * factor + j])
                 paths_fine[:, i * factor + j + 1] = x_fine
-            x_coarse = self.step(t, x_coarse, h_coarse,
+            x_coarse = self.step(time_points[(i + 1) * factor], x_coarse, h_coarse,
                                  torch.sum(corr_normals[:, (i * factor):((i + 1) * factor)], dim=1))
             paths_coarse[:, i + 1] = x_coarse
         return (paths_fine, paths_coarse), corr_normals
@@ -127,6 +129,14 @@ class HestonSolver(HestonScheme, DiffusionSolver):
     pass
 
 
+class GbmSolver(GbmScheme, DiffusionSolver):
+    """Euler solver specialised to the Gbm class (not its subclasses, e.g. LogGbm, which have different
+    coefficients)"""
+    def __init__(self, sde, time_interval, num_steps, device='cpu', seed=1):
+        assert type(sde) is Gbm, 'GbmSolver can only be used with a Gbm, use EulerSolver instead'
+        super(GbmSolver, self).__init__(sde, time_interval, num_steps, device, seed)
+
+
 class JumpDiffusionSolver(SdeSolver):
     def __init__(self, sde, time_interval, num_steps, device='cpu', seed=1, exact_jumps=False):
         super(JumpDiffusionSolver, self).__init__(sde, time_interval, num_steps, device, seed)
@@ -144,7 +154,7 @@ class JumpDiffusionSolver(SdeSolver):
         return torch.empty(size, device=self.device).exponential_(self.sde.jump_rate().sum()).cumsum(dim=1)
 
     def sample_one_jump(self, size):
-        jumps = self.sde.sample_jumps([size, 1], self.device).repeat(1, self.sde.dim)
+        jumps = self.sde.sample_jumps([size, 1], self.device).expand(-1, self.sde.dim)
         return jumps
 
     def init_storage(self, bs, steps, low_storage=False):
@@ -161,10 +171,11 @@ class JumpDiffusionSolver(SdeSolver):
                                   device=self.device)
         return paths, left_paths, time_paths, jump_paths, normals
 
+    @torch.no_grad()
     def solve(self, bs=1, return_normals=False, low_storage=False):
         bs = int(bs)
         h = torch.tensor(self.time_interval / self.num_steps, device=self.device)
-        x = self.sde.init_value.unsqueeze(0).repeat(bs, 1).to(self.device)
+        x = self.sde.init_value.to(self.device).expand(bs, -1)
         t = torch.zeros((bs, 1), device=self.device)
 
         paths, left_paths, time_paths, jump_paths, normals = self.init_storage(bs, self.num_steps + self.max_jumps,
@@ -176,6 +187,7 @@ class JumpDiffusionSolver(SdeSolver):
             time_paths[:, 0] = t
 
         jump_times = self.sample_jump_times(size=(bs, self.max_jumps, 1))
+        batch_idxs = torch.arange(bs, device=self.device)
         jump_idxs = torch.zeros_like(jump_times[:, 0, :]).long()
 
         total_steps = 0
@@ -184,10 +196,10 @@ class JumpDiffusionSolver(SdeSolver):
             total_steps += 1
 
             # times and sizes of the next jump
-            next_jump_time = jump_times[torch.arange(bs), jump_idxs.squeeze(-1), :]
+            next_jump_time = jump_times[batch_idxs, jump_idxs.squeeze(-1), :]
 
             # time step is minimum of (prescribed maximum mesh size, time to next jump, time to end of interval)
-            h = torch.minimum(h, torch.maximum(self.time_interval - t, torch.tensor(0.)))
+            h = torch.minimum(h, (self.time_interval - t).clamp(min=0))
             dt = torch.minimum(h, next_jump_time - t)
 
             assert (next_jump_time >= t).all()
@@ -197,7 +209,7 @@ class JumpDiffusionSolver(SdeSolver):
             else:
                 corr_normals = torch.stack([
                     self.sample_corr_normals(x.shape + torch.Size([1]), dt.unsqueeze(-1)),
-                    self.sample_corr_normals([x.shape[0], 1, 1], dt.unsqueeze(-1), corr=False).repeat(1, x.shape[1])
+                    self.sample_corr_normals([x.shape[0], 1, 1], dt.unsqueeze(-1), corr=False).expand(-1, x.shape[1])
                 ], dim=-1)
             old_x = x
             x = self.step(t, x, dt, corr_normals)
@@ -225,6 +237,7 @@ class JumpDiffusionSolver(SdeSolver):
             jump_idxs = torch.where(torch.isclose(next_jump_time, t, atol=1e-12), jump_idxs + 1, jump_idxs)
         return paths[:, :total_steps + 1], (normals, time_paths, left_paths, total_steps, jump_paths)
 
+    @torch.no_grad()
     def multilevel_solve(self, bs, levels, return_normals=False):
         bs = int(bs)
         fine, coarse = levels
@@ -236,8 +249,8 @@ class JumpDiffusionSolver(SdeSolver):
         t_fine = torch.zeros((bs, 1), device=self.device)
         t_coarse = torch.zeros((bs, 1), device=self.device)
 
-        x_fine = self.sde.init_value.unsqueeze(0).repeat(bs, 1).to(self.device)
-        x_coarse = self.sde.init_value.unsqueeze(0).repeat(bs, 1).to(self.device)
+        x_fine = self.sde.init_value.to(self.device).expand(bs, -1)
+        x_coarse = self.sde.init_value.to(self.device).expand(bs, -1)
 
         paths_fine, _, _, _, _ = self.init_storage(bs, coarse + self.max_jumps, low_storage=True)
         paths_coarse, _, _, _, _ = self.init_storage(bs, coarse + self.max_jumps, low_storage=True)
@@ -245,6 +258,7 @@ class JumpDiffusionSolver(SdeSolver):
         paths_coarse[:, 0] = x_coarse
 
         jump_times = self.sample_jump_times(size=(bs, self.max_jumps, 1))
+        batch_idxs = torch.arange(bs, device=self.device)
         jump_idxs = torch.zeros_like(jump_times[:, 0, :]).long()
 
         total_steps_fine = 0
@@ -253,13 +267,13 @@ class JumpDiffusionSolver(SdeSolver):
             run_sum_normals = 0
 
             # times and sizes of the next jump
-            next_jump_time = jump_times[torch.arange(bs), jump_idxs.squeeze(-1), :]
+            next_jump_time = jump_times[batch_idxs, jump_idxs.squeeze(-1), :]
 
             # Do factor steps for the finer level - store the normals
             for i in range(factor):
                 total_steps_fine += 1
                 # time step is minimum of (mesh size, time to next jump, time to end of interval)
-                h_fine = torch.minimum(h_fine, torch.maximum(self.time_interval - t_fine, torch.tensor(0.)))
+                h_fine = torch.minimum(h_fine, (self.time_interval - t_fine).clamp(min=0))
                 dt_fine = torch.minimum(h_fine, next_jump_time - t_fine)
                 assert (next_jump_time >= t_fine).all()
                 # step diffusion until the next time step
@@ -268,9 +282,8 @@ class JumpDiffusionSolver(SdeSolver):
                 else:
                     corr_normals = torch.stack([
                         self.sample_corr_normals(x_fine.shape + torch.Size([1]), dt_fine.unsqueeze(-1)),
-                        self.sample_corr_normals([x_fine.shape[0], 1, 1], dt_fine.unsqueeze(-1), corr=False).repeat(1,
-                                                                                                                    x_fine.shape[
-                                                                                                                        1])
+                        self.sample_corr_normals([x_fine.shape[0], 1, 1], dt_fine.unsqueeze(-1),
+                                                 corr=False).expand(-1, x_fine.shape[1])
                     ], dim=-1)
                 old_x_fine = x_fine
                 x_fine = self.step(t_fine, x_fine, dt_fine, corr_normals)
@@ -279,7 +292,7 @@ class JumpDiffusionSolver(SdeSolver):
 
             # Do one step on the coarser level
             total_steps_coarse += 1
-            h_coarse = torch.minimum(h_coarse, torch.maximum(self.time_interval - t_coarse, torch.tensor(0.)))
+            h_coarse = torch.minimum(h_coarse, (self.time_interval - t_coarse).clamp(min=0))
             dt_coarse = torch.minimum(h_coarse, next_jump_time - t_coarse)
             old_x_coarse = x_coarse
             x_coarse = self.step(t_coarse, x_coarse, dt_coarse, run_sum_normals)  # check this
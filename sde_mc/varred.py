@@ -25,6 +25,7 @@ def train_diffusion_control_variate(model, opt, dl, solver, discounter, epochs,
     trials, steps, dim = dl.dataset.paths.shape
     time_points = partition(solver.time_interval, solver.num_steps, ends='left', device=solver.device)
     discounts = discounter(time_points).view(1, len(time_points), 1)
+    f_in = init_cv_inputs(time_points, dl.batch_size, dim, model.sequential)
     loss_arr = []
 
     epoch_total_cost = 0
@@ -37,11 +38,9 @@ def train_diffusion_control_variate(model, opt, dl, solver, discounter, epochs,
             opt.zero_grad()
 
             if model.sequential:
-                rep_time_points = time_points.unsqueeze(-1).repeat(dl.batch_size, 1, 1)
-                f_in = torch.cat([rep_time_points, paths], dim=-1)
+                f_in[..., 1:] = paths
             else:
-                rep_time_points = time_points.repeat(dl.batch_size).unsqueeze(-1)
-                f_in = torch.cat([rep_time_points, paths.reshape(dl.batch_size * steps, dim)], dim=-1)
+                f_in[:, 1:] = paths.reshape(dl.batch_size * steps, dim)
 
             f_out = model(f_in).view(dl.batch_size, steps, dim)
             brownians_cv = integrate_cv(normals, f_out, discounts, solver.sde.diffusion_struct, tol=tol,
@@ -72,21 +71,20 @@ def train_diffusion_control_variate(model, opt, dl, solver, discounter, epochs,
     return end_train - start_train, loss_arr
 
 
-def apply_diffusion_control_variate(model, dl, solver, discounter, tol=0):
+def apply_diffusion_control_variate(model, dl, solver, discounter, tol=0, amp_dtype=None):
     trials, steps, dim = dl.dataset.paths.shape
     time_points = partition(solver.time_interval, solver.num_steps, ends='left', device=solver.device)
     discounts = discounter(time_points).view(1, len(time_points), 1)
 
     run_sum, run_sum_sq = 0, 0
-    with torch.inference_mode():
+    with torch.inference_mode(), autocast_cv(solver.device, amp_dtype):
+        f_in = init_cv_inputs(time_points, dl.batch_size, dim, model.sequential)
         for (paths, normals), payoffs in dl:
             if model.sequential:
-                rep_time_points = time_points.unsqueeze(-1).repeat(dl.batch_size, 1, 1)
-                f_in = torch.cat([rep_time_points, paths], dim=-1)
+                f_in[..., 1:] = paths
             else:
-                rep_time_points = time_points.repeat(dl.batch_size).unsqueeze(-1)
-                f_in = torch.cat([rep_time_points, paths.reshape(dl.batch_size * steps, dim)], dim=-1)
-            f_out = model(f_in).view(dl.batch_size, steps, dim)
+                f_in[:, 1:] = paths.reshape(dl.batch_size * steps, dim)
+            f_out = model(f_in).to(paths.dtype).view(dl.batch_size, steps, dim)
             brownians_cv = integrate_cv(normals, f_out, discounts, solver.sde.diffusion_struct, tol=tol,
                                         time_interval=solver.time_interval)
             gammas = payoffs + brownians_cv
@@ -95,11 +93,11 @@ def apply_diffusion_control_variate(model, dl, solver, discounter, tol=0):
     return run_sum, run_sum_sq
 
 
-def apply_adapted_control_variates(models, dl, solver, discounter, tol=0):
+def apply_adapted_control_variates(models, dl, solver, discounter, tol=0, amp_dtype=None):
     n, steps, dim = dl.dataset.paths.shape
     f, g = models
     run_sum, run_sum_sq = 0, 0
-    with torch.inference_mode():
+    with torch.inference_mode(), autocast_cv(solver.device, amp_dtype):
         for (paths, normals, left_paths, time_paths, jump_paths), payoffs in dl:
             h = torch.diff(time_paths, dim=1)
             discounts = discounter(time_paths)
@@ -110,7 +108,7 @@ def apply_adapted_control_variates(models, dl, solver, discounter, tol=0):
                 paths_inputs = paths.reshape(dl.batch_size * steps, dim)
                 f_inputs = torch.cat([time_inputs, paths_inputs], dim=-1)
 
-            f_outputs = f(f_inputs).view(normals.shape)
+            f_outputs = f(f_inputs).to(paths.dtype).view(normals.shape)
 
             brownian_cv = integrate_cv(normals, f_outputs, discounts, solver.sde.diffusion_struct, tol=tol,
                                        time_interval=solver.time_interval)
@@ -119,8 +117,8 @@ def apply_adapted_control_variates(models, dl, solver, discounter, tol=0):
                 g_inputs = torch.cat([time_paths, left_paths], dim=-1)
             else:
                 time_inputs = time_paths.reshape(dl.batch_size * steps, 1)
-                g_inputs = torch.cat([time_inputs, left_paths.view(dl.batch_size * steps, dim)], dim=-1)
-            g_outputs = g(g_inputs).view(dl.batch_size, steps, dim)
+                g_inputs = torch.cat([time_inputs, left_paths.reshape(dl.batch_size * steps, dim)], dim=-1)
+            g_outputs = g(g_inputs).to(paths.dtype).view(dl.batch_size, steps, dim)
             jump_cv = (g_outputs * discounts * jump_paths).sum(-1).sum(-1)
 
             comps = (- solver.sde.jump_rate() * solver.sde.jump_mean() * g_outputs[:, :-1] *
@@ -165,7 +163,7 @@ def train_adapted_control_variates(models, opt, dl, solver, discounter, epochs=1
             else:
                 time_inputs = time_paths.reshape(dl.batch_size * steps, 1)
                 paths_inputs = paths.reshape(dl.batch_size * steps, dim)
-                g_inputs = torch.cat([time_inputs, left_paths.view(dl.batch_size * steps, dim)], dim=-1)
+                g_inputs = torch.cat([time_inputs, left_paths.reshape(dl.batch_size * steps, dim)], dim=-1)
 
             g_outputs = g(g_inputs).view(dl.batch_size, steps, dim)
             jump_cv = (g_outputs * discounts * jump_paths).sum(-1).sum(-1)
@@ -199,6 +197,70 @@ def train_adapted_control_variates(models, opt, dl, solver, discounter, epochs=1
     return loss_arr
 
 
+def autocast_cv(device, amp_dtype=None):
+    """Context manager to evaluate the control variate models in lower precision (e.g. torch.bfloat16) during
+    inference. The outputs are cast back to the precision of the paths, so the control variates are still integrated
+    in full precision. Disabled when amp_dtype is None
+
+    :param device: str
+        The device the models are evaluated on
+
+    :param amp_dtype: torch.dtype (default = None)
+        The dtype to evaluate the models in
+
+    :return: torch.autocast
+    """
+    return torch.autocast(torch.device(device).type, dtype=amp_dtype, enabled=amp_dtype is not None)
+
+
+def repeat_time_points(time_points, bs, sequential):
+    """Repeats the time points across a batch so they can be concatenated with the paths as inputs to a model. The
+    batch size is fixed within a DataLoader, so this only needs to be done once rather than for every batch
+
+    :param time_points: torch.tensor (steps,)
+        The time points of the discretisation
+
+    :param bs: int
+        The batch size
+
+    :param sequential: bool
+        If True, the output is (bs, steps, 1)-shaped, otherwise it is (bs * steps, 1)-shaped
+
+    :return: torch.tensor
+    """
+    if sequential:
+        return time_points.unsqueeze(-1).repeat(bs, 1, 1)
+    else:
+        return time_points.repeat(bs).unsqueeze(-1)
+
+
+def init_cv_inputs(time_points, bs, dim, sequential):
+    """Allocates the input buffer for a control variate model, with the first column holding the time points. The
+    buffer is allocated once per DataLoader and each batch of paths is copied into the remaining columns, rather than
+    concatenating the time points and paths for every batch. The time column is filled by broadcasting, so the time
+    points are not repeated across the batch
+
+    :param time_points: torch.tensor (steps,)
+        The time points of the discretisation
+
+    :param bs: int
+        The batch size
+
+    :param dim: int
+        The dimension of the paths
+
+    :param sequential: bool
+        If True, the output is (bs, steps, dim + 1)-shaped, otherwise it is (bs * steps, dim + 1)-shaped
+
+    :return: torch.tensor
+    """
+    steps = len(time_points)
+    shape = (bs, steps, dim + 1) if sequential else (bs * steps, dim + 1)
+    inputs = torch.empty(shape, device=time_points.device)
+    inputs.view(bs, steps, dim + 1)[..., 0] = time_points
+    return inputs
+
+
 def integrate_cv(normals, f_out, discounts, diffusion_struct, tol=0, time_interval=None):
     if tol != 0:
         assert time_interval is not None
@@ -10,6 +10,25 @@ def test_zero_function():
     assert torch.allclose(f(x), torch.zeros((12, 26)))
 
 
+def test_compiled_mlp():
+    x = torch.randn((8, 2))
+    mlp = Mlp(2, [5, 5], 1).eval()
+    compiled_mlp = Mlp(2, [5, 5], 1, compiled=True).eval()
+    compiled_mlp.load_state_dict(mlp.state_dict())
+    assert torch.allclose(compiled_mlp(x), mlp(x), atol=1e-6)
+
+
+def test_mlp_fuse_bn():
+    x = torch.randn((8, 2))
+    mlp = Mlp(2, [5, 5], 1)
+    for _ in range(5):
+        mlp(torch.randn((16, 2)) * 2 + 1)
+    expected = mlp.eval()(x)
+    mlp.fuse_bn()
+    assert not any(isinstance(layer, nn.BatchNorm1d) for layer in mlp.net)
+    assert torch.allclose(mlp(x), expected, atol=1e-6)
+
+
 def test_lstm():
     x = torch.tensor([[[1., 2.], [3., 4.]]])
     lstm = Lstm(2, 20, 1)
@@ -30,3 +49,18 @@ def test_normal_path_data(gbm_2d_solver):
 def test_normal_jumps_path_data(merton_1d_solver):
     mc_stats = mc_simple(16, merton_1d_solver, EuroCall(1), ConstantShortRate(0.02), return_normals=True)
     data = NormalJumpsPathData(mc_stats.paths, mc_stats.payoffs, mc_stats.normals[0], mc_stats.normals[1])
+
+
+def test_path_data_loader(gbm_2d_solver):
+    mc_stats = mc_simple(10, gbm_2d_solver, EuroCall(1), ConstantShortRate(0.02), return_normals=True)
+    data = NormalPathData(mc_stats.paths, mc_stats.payoffs, mc_stats.normals)
+    dl = PathDataLoader(data, batch_size=4, shuffle=True, drop_last=True)
+    assert len(dl) == 2
+    for (paths, normals), payoffs in dl:
+        assert paths.shape == (4, 10, 2)
+        assert normals.shape == (4, 10, 2)
+        assert payoffs.shape == (4,)
+    dl = PathDataLoader(data, batch_size=4)
+    assert len(dl) == 3
+    payoffs = torch.cat([batch[1] for batch in dl])
+    assert torch.allclose(payoffs, mc_stats.payoffs)
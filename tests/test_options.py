@@ -20,6 +20,28 @@ def test_merton_call():
     assert torch.isclose(output, expected)
 
 
+def test_merton_call_array_strikes():
+    strikes = np.array([0.9, 1., 1.1])
+    output = merton_call(1, strikes, 3, 0.02, 0.3, -0.05, 0.3, 2)
+    expected = np.array([merton_call(1, strike, 3, 0.02, 0.3, -0.05, 0.3, 2) for strike in strikes])
+    assert output.shape == (3,)
+    assert np.allclose(output, expected)
+
+
+def test_merton_call_array_params():
+    expiries = np.array([1., 2., 3.])
+    output = merton_call(1, 1, expiries, 0.02, 0.3, -0.05, 0.3, 2)
+    expected = np.array([merton_call(1, 1, expiry, 0.02, 0.3, -0.05, 0.3, 2) for expiry in expiries])
+    assert output.shape == (3,)
+    assert np.allclose(output, expected)
+    sigmas = np.array([[0.2], [0.3]])
+    output = merton_call(1, np.array([0.9, 1.1]), 3, 0.02, sigmas, -0.05, 0.3, 2)
+    assert output.shape == (2, 2)
+    assert np.isclose(output[1, 0], merton_call(1, 0.9, 3, 0.02, 0.3, -0.05, 0.3, 2))
+    output = merton_call(torch.tensor(1.), torch.tensor([0.9, 1.1]), 3, 0.02, 0.3, -0.05, 0.3, 2)
+    assert np.allclose(output, merton_call(1, np.array([0.9, 1.1]), 3, 0.02, 0.3, -0.05, 0.3, 2))
+
+
 def test_euro_call(terminals_1d):
     euro_call = EuroCall(strike=1)
     assert torch.allclose(euro_call(terminals_1d), torch.tensor([0., 2., 0., 0.]))
@@ -25,3 +25,14 @@ def test_adapted_solver(merton_1d_solver):
     assert not torch.isnan(jump_paths).any()
 
 
+def test_gbm_solver(gbm_2d, gbm_2d_solver):
+    paths, normals = gbm_2d_solver.solve(bs=4)
+    gbm_solver = GbmSolver(gbm_2d, 3, 10)
+    gbm_paths, gbm_normals = gbm_solver.solve(bs=4)
+    assert torch.allclose(normals, gbm_normals)
+    assert torch.allclose(paths, gbm_paths)
+
+
+def test_gbm_solver_rejects_subclasses(log_gbm):
+    with pytest.raises(AssertionError):
+        GbmSolver(log_gbm, 3, 10)
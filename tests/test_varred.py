@@ -37,3 +37,13 @@ def test_train_adapted(mlps_1d, sample_adapted_dataloader, merton_1d_solver, con
 
 def test_apply_adapted(mlps_1d, sample_adapted_dataloader, merton_1d_solver, constant_short_rate):
     apply_adapted_control_variates(mlps_1d, sample_adapted_dataloader, merton_1d_solver, constant_short_rate)
+
+
+def test_apply_dcv_bfloat16(mlps_1d, gbm_1d_solver, euro_call, constant_short_rate):
+    dl = simulate_data(10, gbm_1d_solver, euro_call, constant_short_rate, bs=2, inference=True)
+    mlps_1d[0].eval()
+    run_sum, run_sum_sq = apply_diffusion_control_variate(mlps_1d[0], dl, gbm_1d_solver, constant_short_rate)
+    amp_sum, amp_sum_sq = apply_diffusion_control_variate(mlps_1d[0], dl, gbm_1d_solver, constant_short_rate,
+                                                          amp_dtype=torch.bfloat16)
+    assert amp_sum.dtype == run_sum.dtype
+    assert torch.isclose(amp_sum, run_sum, rtol=0.05, atol=0.05)